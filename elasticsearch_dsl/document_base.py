@@ -138,6 +138,11 @@ class DocumentOptions:
 
         # create the mapping instance
         self.mapping: Mapping = getattr(meta, "mapping", Mapping())
+        # the mapping's dict of fields is only ever updated in place, keep a
+        # reference to it so that field lookups are a single dict access
+        self.fields: Dict[str, Field] = self.mapping.properties._params.setdefault(
+            "properties", {}
+        )
 
         # register the document's fields, which can be given in a few formats:
         #
@@ -27,7 +27,6 @@ from typing import (
     Iterable,
     Iterator,
     Optional,
-    Tuple,
     Type,
     Union,
     cast,
@@ -151,10 +150,9 @@ class Field(DslBase):
         return data
 
     def to_dict(self) -> Dict[str, Any]:
-        d = super().to_dict()
-        name, value = cast(Tuple[str, Dict[str, Any]], d.popitem())
-        value["type"] = name
-        return value
+        d = self._params_to_dict()
+        d["type"] = self.name
+        return d
 
 
 class CustomField(Field):
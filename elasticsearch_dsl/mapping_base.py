@@ -45,18 +45,21 @@ class Properties(DslBase):
 
     def __init__(self) -> None:
         super().__init__()
+        # create the fields dict upfront so that lookups can use it directly
+        # instead of going through an AttrDict wrapper
+        self._params["properties"] = {}
 
     def __repr__(self) -> str:
         return "Properties()"
 
     def __getitem__(self, name: str) -> Field:
-        return self.properties[name]
+        return cast(Field, self._params["properties"][name])
 
     def __contains__(self, name: str) -> bool:
-        return name in self.properties
+        return name in self._params["properties"]
 
     def to_dict(self) -> Dict[str, Any]:
-        return cast(Dict[str, Field], super().to_dict()["properties"])
+        return self._params_to_dict()
 
     def field(self, name: str, *args: Any, **kwargs: Any) -> Self:
         self.properties[name] = construct_field(*args, **kwargs)
@@ -98,7 +101,12 @@ class MappingBase:
 
     def _clone(self) -> Self:
         m = self.__class__()
-        m.properties._params = self.properties._params.copy()
+        # copy the fields dict as well, it is always present and fields added
+        # to the clone must not show up in the original
+        m.properties._params = {
+            **self.properties._params,
+            "properties": dict(self.properties._params["properties"]),
+        }
         return m
 
     def resolve_nested(
@@ -183,13 +191,13 @@ class MappingBase:
             self._meta.update(mapping._meta)
 
     def __contains__(self, name: str) -> bool:
-        return name in self.properties.properties
+        return name in self.properties
 
     def __getitem__(self, name: str) -> Field:
-        return self.properties.properties[name]
+        return self.properties[name]
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.properties.properties)
+        return iter(self.properties._params["properties"])
 
     def field(self, *args: Any, **kwargs: Any) -> Self:
         self.properties.field(*args, **kwargs)
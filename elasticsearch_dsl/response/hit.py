@@ -21,6 +21,8 @@ from ..utils import AttrDict, HitMeta
 
 
 class Hit(AttrDict[Any]):
+    __slots__ = ("meta",)
+
     def __init__(self, document: Dict[str, Any]):
         data: Dict[str, Any] = {}
         if "_source" in document:
@@ -131,7 +131,7 @@ class AggsProxy(AggBase[_R], DslBase):
         self._params = {"aggs": {}}
 
     def to_dict(self) -> Dict[str, Any]:
-        return cast(Dict[str, Any], super().to_dict().get("aggs", {}))
+        return self._params_to_dict()
 
 
 class Request(Generic[_R]):
@@ -24,6 +24,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
     Iterator,
@@ -82,6 +83,13 @@ META_FIELDS = frozenset(
 
 
 def _wrap(val: Any, obj_wrapper: Optional[Callable[[Any], Any]] = None) -> Any:
+    # deserialized responses only ever contain plain dicts and lists, check
+    # for those exact types before falling back to the subclass checks
+    t = type(val)
+    if t is dict:
+        return AttrDict(val) if obj_wrapper is None else obj_wrapper(val)
+    if t is list:
+        return AttrList(val)
     if isinstance(val, dict):
         return AttrDict(val) if obj_wrapper is None else obj_wrapper(val)
     if isinstance(val, list):
@@ -114,6 +122,8 @@ class AttrList(Generic[_ValT]):
         return repr(self._l_)
 
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
         if isinstance(other, AttrList):
             return other._l_ == self._l_
         # make sure we still equal to a dict with the same data
@@ -132,11 +142,16 @@ class AttrList(Generic[_ValT]):
         self._l_[k] = value
 
     def __iter__(self) -> Iterator[Any]:
-        return map(lambda i: _wrap(i, self._obj_wrapper), self._l_)
+        obj_wrapper = self._obj_wrapper
+        return (_wrap(i, obj_wrapper) for i in self._l_)
 
     def __len__(self) -> int:
         return len(self._l_)
 
+    def __contains__(self, item: Any) -> bool:
+        # compare against the raw values, without wrapping every item
+        return item in self._l_
+
     def __nonzero__(self) -> bool:
         return bool(self._l_)
 
@@ -164,12 +179,17 @@ class AttrDict(Generic[_ValT]):
     nested dsl dicts.
     """
 
+    # plain AttrDict wrappers are created for every nested dict in a response,
+    # don't give each of them an instance __dict__ (subclasses still get one)
+    __slots__ = ("_d_",)
+
     _d_: Dict[str, _ValT]
     RESERVED: Dict[str, str] = {"from_": "from"}
 
     def __init__(self, d: Dict[str, _ValT]):
-        # assign the inner dict manually to prevent __setattr__ from firing
-        super().__setattr__("_d_", d)
+        # assign the inner dict manually to prevent __setattr__ from firing,
+        # object.__setattr__ avoids building a super() proxy for every wrapper
+        object.__setattr__(self, "_d_", d)
 
     def __contains__(self, key: object) -> bool:
         return key in self._d_
@@ -184,6 +204,8 @@ class AttrDict(Generic[_ValT]):
         return list(self._d_.keys())
 
     def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
         if isinstance(other, AttrDict):
             return other._d_ == self._d_
         # make sure we still equal to a dict with the same data
@@ -202,15 +224,20 @@ class AttrDict(Generic[_ValT]):
         return (self._d_,)
 
     def __setstate__(self, state: Tuple[Dict[str, _ValT]]) -> None:
-        super().__setattr__("_d_", state[0])
+        object.__setattr__(self, "_d_", state[0])
 
     def __getattr__(self, attr_name: str) -> Any:
+        # this is the hot path when consuming results, so look the key up
+        # directly unless a subclass customizes item access
         try:
-            return self.__getitem__(attr_name)
+            if type(self).__getitem__ is not AttrDict.__getitem__:
+                return self[attr_name]
+            value = self._d_[self.RESERVED.get(attr_name, attr_name)]
         except KeyError:
             raise AttributeError(
                 f"{self.__class__.__name__!r} object has no attribute {attr_name!r}"
             )
+        return _wrap(value)
 
     def __delattr__(self, attr_name: str) -> None:
         try:
@@ -255,6 +282,43 @@ class AttrDict(Generic[_ValT]):
         return self._d_.items()
 
 
+class _TypedParam:
+    """
+    Descriptor giving direct access to a typed param of a DslBase subclass.
+
+    Reading typed params (``Bool.must``, ``Bool.should`` etc.) is the hot path
+    when combining queries; with this descriptor on the class the value is
+    found without a failed attribute lookup and a call to ``__getattr__``.
+    Writes still go through ``DslBase.__setattr__``.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Optional["DslBase"], owner: type) -> Any:
+        if instance is None:
+            return self
+        name = self.name
+        try:
+            value = instance._params[name]
+        except KeyError:
+            # compound types should never throw AttributeError and return
+            # empty container instead
+            if name in instance._multi_params:
+                value = instance._params.setdefault(name, [])
+            elif name in instance._hash_params:
+                value = instance._params.setdefault(name, {})
+            else:
+                raise AttributeError(
+                    f"{owner.__name__!r} object has no attribute {name!r}"
+                )
+
+        # wrap nested dicts in AttrDict for convenient access
+        if isinstance(value, dict):
+            return AttrDict(value)
+        return value
+
+
 class DslMeta(type):
     """
     Base Metaclass for DslBase subclasses that builds a registry of all classes
@@ -272,9 +336,32 @@ class DslMeta(type):
     _classes: Dict[str, type]
     _type_name: str
     _types: ClassVar[Dict[str, Type["DslBase"]]] = {}
+    _param_defs: Dict[str, Dict[str, Union[str, bool]]]
+    _typed_params: FrozenSet[str]
+    _multi_params: FrozenSet[str]
+    _hash_params: FrozenSet[str]
+    _param_shortcuts: Dict[str, Callable[..., Any]]
 
     def __init__(cls, name: str, bases: Tuple[type, ...], attrs: Dict[str, Any]):
         super().__init__(name, bases, attrs)
+        # resolve the param definitions once per class so that attribute
+        # access and serialization only need a set membership test
+        param_defs = getattr(cls, "_param_defs", {})
+        cls._typed_params = frozenset(n for n, p in param_defs.items() if "type" in p)
+        cls._multi_params = frozenset(
+            n for n, p in param_defs.items() if p.get("multi")
+        )
+        cls._hash_params = frozenset(n for n, p in param_defs.items() if p.get("hash"))
+        # shortcuts for typed params, filled on first use since the shortcut
+        # for a type might not be registered yet when the class is created
+        cls._param_shortcuts = {}
+        for pname in cls._typed_params:
+            # don't shadow methods or attributes defined on the class itself
+            if not any(
+                pname in b.__dict__ and not isinstance(b.__dict__[pname], _TypedParam)
+                for b in cls.__mro__
+            ):
+                setattr(cls, pname, _TypedParam(pname))
         # skip for DslBase
         if not hasattr(cls, "_type_shortcut"):
             return
@@ -348,14 +435,23 @@ class DslBase(metaclass=DslMeta):
             f"{n.replace('.', '__')}={v!r}"
             for (n, v) in sorted(self._params.items())
             # make sure we don't include empty typed params
-            if "type" not in self._param_defs.get(n, {}) or v
+            if n not in self._typed_params or v
         )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self._repr_params()})"
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, self.__class__) and other.to_dict() == self.to_dict()
+        if other is self:
+            return True
+        if not isinstance(other, self.__class__):
+            return False
+        # identical params on the same class serialize identically, only walk
+        # the whole tree via to_dict() when they differ (empty typed params
+        # that are skipped on serialization, subclasses with another name)
+        if type(other) is type(self) and other._params == self._params:
+            return True
+        return other.to_dict() == self.to_dict()
 
     def __ne__(self, other: Any) -> bool:
         return not self == other
@@ -368,32 +464,34 @@ class DslBase(metaclass=DslMeta):
     def _setattr(self, name: str, value: Any) -> None:
         # if this attribute has special type assigned to it...
         name = AttrDict.RESERVED.get(name, name)
-        if name in self._param_defs:
-            pinfo = self._param_defs[name]
-
-            if "type" in pinfo:
-                # get the shortcut used to construct this type (query.Q, aggs.A, etc)
-                shortcut = self.__class__.get_dsl_type(str(pinfo["type"]))
-
-                # list of dict(name -> DslBase)
-                if pinfo.get("multi") and pinfo.get("hash"):
-                    if not isinstance(value, (tuple, list)):
-                        value = (value,)
-                    value = list(
-                        {k: shortcut(v) for (k, v) in obj.items()} for obj in value
-                    )
-                elif pinfo.get("multi"):
-                    if not isinstance(value, (tuple, list)):
-                        value = (value,)
-                    value = list(map(shortcut, value))
-
-                # dict(name -> DslBase), make sure we pickup all the objs
-                elif pinfo.get("hash"):
-                    value = {k: shortcut(v) for (k, v) in value.items()}
-
-                # single value object, just convert
-                else:
-                    value = shortcut(value)
+        if name in self._typed_params:
+            # get the shortcut used to construct this type (query.Q, aggs.A, etc)
+            try:
+                shortcut = self._param_shortcuts[name]
+            except KeyError:
+                shortcut = self._param_shortcuts[name] = self.__class__.get_dsl_type(
+                    str(self._param_defs[name]["type"])
+                )
+            is_multi = name in self._multi_params
+            is_hash = name in self._hash_params
+
+            # list of dict(name -> DslBase)
+            if is_multi and is_hash:
+                if not isinstance(value, (tuple, list)):
+                    value = (value,)
+                value = [{k: shortcut(v) for (k, v) in obj.items()} for obj in value]
+            elif is_multi:
+                if not isinstance(value, (tuple, list)):
+                    value = (value,)
+                value = [shortcut(v) for v in value]
+
+            # dict(name -> DslBase), make sure we pickup all the objs
+            elif is_hash:
+                value = {k: shortcut(v) for (k, v) in value.items()}
+
+            # single value object, just convert
+            else:
+                value = shortcut(value)
         self._params[name] = value
 
     def __getattr__(self, name: str) -> Any:
@@ -408,12 +506,10 @@ class DslBase(metaclass=DslMeta):
         except KeyError:
             # compound types should never throw AttributeError and return empty
             # container instead
-            if name in self._param_defs:
-                pinfo = self._param_defs[name]
-                if pinfo.get("multi"):
-                    value = self._params.setdefault(name, [])
-                elif pinfo.get("hash"):
-                    value = self._params.setdefault(name, {})
+            if name in self._multi_params:
+                value = self._params.setdefault(name, [])
+            elif name in self._hash_params:
+                value = self._params.setdefault(name, {})
         if value is None:
             raise AttributeError(
                 f"{self.__class__.__name__!r} object has no attribute {name!r}"
@@ -428,28 +524,34 @@ class DslBase(metaclass=DslMeta):
         """
         Serialize the DSL object to plain dict
         """
+        return {self.name: self._params_to_dict()}
+
+    def _params_to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the parameters of the DSL object, without wrapping them in
+        a dict keyed by the object's name.
+        """
         d = {}
         for pname, value in self._params.items():
-            pinfo = self._param_defs.get(pname)
-
             # typed param
-            if pinfo and "type" in pinfo:
+            if pname in self._typed_params:
                 # don't serialize empty lists and dicts for typed fields
-                if value in ({}, []):
+                if not value and isinstance(value, (list, dict)):
                     continue
 
+                is_multi = pname in self._multi_params
+                is_hash = pname in self._hash_params
+
                 # list of dict(name -> DslBase)
-                if pinfo.get("multi") and pinfo.get("hash"):
-                    value = list(
-                        {k: v.to_dict() for k, v in obj.items()} for obj in value
-                    )
+                if is_multi and is_hash:
+                    value = [{k: v.to_dict() for k, v in obj.items()} for obj in value]
 
                 # multi-values are serialized as list of dicts
-                elif pinfo.get("multi"):
-                    value = list(map(lambda x: x.to_dict(), value))
+                elif is_multi:
+                    value = [x.to_dict() for x in value]
 
                 # squash all the hash values into one dict
-                elif pinfo.get("hash"):
+                elif is_hash:
                     value = {k: v.to_dict() for k, v in value.items()}
 
                 # serialize single values
@@ -461,12 +563,23 @@ class DslBase(metaclass=DslMeta):
                 value = value.to_dict()
 
             d[pname] = value
-        return {self.name: d}
+        return d
 
     def _clone(self) -> Self:
         c = self.__class__()
-        for attr in self._params:
-            c._params[attr] = copy(self._params[attr])
+        params = c._params
+        for attr, value in self._params.items():
+            # shallow copy the common containers and skip immutable scalars
+            # without going through the copy module's dispatch
+            t = type(value)
+            if t is list:
+                params[attr] = value[:]
+            elif t is dict:
+                params[attr] = value.copy()
+            elif t is str or t is int or t is float or t is bool:
+                params[attr] = value
+            else:
+                params[attr] = copy(value)
         return c
 
 
@@ -477,6 +590,8 @@ else:
 
 
 class HitMeta(HitMetaBase):
+    __slots__ = ()
+
     inner_hits: Mapping[str, Any]
 
     def __init__(
@@ -542,16 +657,15 @@ class ObjectBase(AttrDict[Any]):
 
     @classmethod
     def __get_field(cls, name: str) -> Optional["Field"]:
-        try:
-            return cls._doc_type.mapping[name]
-        except KeyError:
+        field = cls._doc_type.fields.get(name)
+        if field is None:
             # fallback to fields on the Index
             if hasattr(cls, "_index") and cls._index._mapping:
                 try:
                     return cls._index._mapping[name]
                 except KeyError:
                     pass
-            return None
+        return field
 
     @classmethod
     def from_es(cls, hit: Union[Dict[str, Any], "ObjectApiResponse[Any]"]) -> Self:
@@ -562,11 +676,17 @@ class ObjectBase(AttrDict[Any]):
         return doc
 
     def _from_dict(self, data: Dict[str, Any]) -> None:
+        d = self._d_
+        fields = self._doc_type.fields
         for k, v in data.items():
             f = self.__get_field(k)
             if f and f._coerce:
                 v = f.deserialize(v)
-            setattr(self, k, v)
+            if k in fields:
+                # mapped fields always end up in _d_, see __setattr__
+                d[k] = v
+            else:
+                setattr(self, k, v)
 
     def __getstate__(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:  # type: ignore[override]
         return self.to_dict(), self.meta._d_
@@ -610,8 +730,9 @@ class ObjectBase(AttrDict[Any]):
 
             if skip_empty:
                 # don't serialize empty values
-                # careful not to include numeric zeros
-                if v in ([], {}, None):
+                # careful not to include numeric zeros, only falsy values
+                # need the (slower) comparison with the empty containers
+                if v is None or (not v and v in ([], {})):
                     continue
 
             out[k] = v
@@ -657,17 +778,25 @@ def merge(
             f"You can only merge two dicts! Got {data!r} and {new_data!r} instead."
         )
 
-    for key, value in new_data.items():
-        if (
-            key in data
-            and isinstance(data[key], (AttrDict, collections.abc.Mapping))
-            and isinstance(value, (AttrDict, collections.abc.Mapping))
-        ):
-            merge(data[key], value, raise_on_conflict)  # type: ignore
-        elif key in data and data[key] != value and raise_on_conflict:
-            raise ValueError(f"Incompatible data for key {key!r}, cannot be merged.")
-        else:
-            data[key] = value
+    # walk nested dicts with an explicit stack instead of recursing
+    mapping_types = (AttrDict, collections.abc.Mapping)
+    stack = [(data, new_data)]
+    while stack:
+        data, new_data = stack.pop()
+        for key, value in new_data.items():
+            if key not in data:
+                data[key] = value
+                continue
+
+            current = data[key]
+            if isinstance(current, mapping_types) and isinstance(value, mapping_types):
+                stack.append((current, value))
+            elif current != value and raise_on_conflict:
+                raise ValueError(
+                    f"Incompatible data for key {key!r}, cannot be merged."
+                )
+            else:
+                data[key] = value
 
 
 def recursive_to_dict(data: Any) -> Any:
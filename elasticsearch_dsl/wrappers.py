@@ -44,6 +44,8 @@ __all__ = ["Range"]
 
 
 class Range(AttrDict[RangeValT]):
+    __slots__ = ()
+
     OPS: ClassVar[
         Mapping[
             ComparisonOperators,
@@ -85,21 +87,27 @@ class Range(AttrDict[RangeValT]):
         super().__init__(data)
 
     def __repr__(self) -> str:
-        return "Range(%s)" % ", ".join("%s=%r" % op for op in self._d_.items())
+        ops = ", ".join(f"{k}={v!r}" for k, v in self._d_.items())
+        return f"Range({ops})"
 
     def __contains__(self, item: object) -> bool:
         if isinstance(item, str):
             return super().__contains__(item)
 
-        item_supports_comp = any(hasattr(item, f"__{op}__") for op in self.OPS)
-        if not item_supports_comp:
+        # check the (at most two) bounds directly rather than looping over
+        # all the operators in OPS
+        d = self._d_
+        value = cast("_SupportsComparison", item)
+        if "gt" in d:
+            if not value > d["gt"]:
+                return False
+        elif "gte" in d and not value >= d["gte"]:
             return False
-
-        for op in self.OPS:
-            if op in self._d_ and not self.OPS[op](
-                cast("_SupportsComparison", item), self._d_[op]
-            ):
+        if "lt" in d:
+            if not value < d["lt"]:
                 return False
+        elif "lte" in d and not value <= d["lte"]:
+            return False
         return True
 
     @property
@@ -37,14 +37,17 @@ Key concepts:
 """
 import asyncio
 import os
+import re
 from datetime import datetime
-from fnmatch import fnmatch
+from fnmatch import translate
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from elasticsearch_dsl import AsyncDocument, Keyword, async_connections, mapped_field
 
 ALIAS = "test-blog"
 PATTERN = ALIAS + "-*"
+# compiled once, _matches() is called for every hit of every search
+PATTERN_RE = re.compile(translate(PATTERN))
 PRIORITY = 100
 
 
@@ -66,7 +69,7 @@ class BlogPost(AsyncDocument):
     def _matches(cls, hit: Dict[str, Any]) -> bool:
         # override _matches to match indices in a pattern instead of just ALIAS
         # hit is the raw dict as returned by elasticsearch
-        return fnmatch(hit["_index"], PATTERN)
+        return PATTERN_RE.match(hit["_index"]) is not None
 
     class Index:
         # we will use an alias instead of the index
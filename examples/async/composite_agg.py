@@ -17,11 +17,11 @@
 
 import asyncio
 import os
-from typing import Any, AsyncIterator, Dict, Mapping, Sequence, cast
+from typing import AsyncIterator, Dict, Mapping, Sequence, cast
 
 from elasticsearch.helpers import async_bulk
 
-from elasticsearch_dsl import Agg, AsyncSearch, Response, aggs, async_connections
+from elasticsearch_dsl import Agg, AsyncSearch, aggs, async_connections
 from elasticsearch_dsl.types import CompositeAggregate
 from tests.test_integration.test_data import DATA, GIT_INDEX
 
@@ -30,7 +30,7 @@ async def scan_aggs(
     search: AsyncSearch,
     source_aggs: Sequence[Mapping[str, Agg]],
     inner_aggs: Dict[str, Agg] = {},
-    size: int = 10,
+    size: int = 1000,
 ) -> AsyncIterator[CompositeAggregate]:
     """
     Helper function used to iterate over all possible bucket combinations of
@@ -38,35 +38,36 @@ async def scan_aggs(
     ``composite`` aggregation under the hood to perform this.
     """
 
-    async def run_search(**kwargs: Any) -> Response:
-        s = search[:0]
-        bucket = s.aggs.bucket(
-            "comp",
-            aggs.Composite(
-                sources=source_aggs,
-                size=size,
-                **kwargs,
-            ),
-        )
-        for agg_name, agg in inner_aggs.items():
-            bucket[agg_name] = agg
-        return await s.execute()
+    # build the search once and only move the composite aggregation forward
+    # for every page; the hits are not needed, skip fetching and counting them
+    s = search[:0].extra(track_total_hits=False)
+    bucket = s.aggs.bucket("comp", aggs.Composite(sources=source_aggs, size=size))
+    for agg_name, agg in inner_aggs.items():
+        bucket[agg_name] = agg
 
-    response = await run_search()
-    while response.aggregations["comp"].buckets:
-        for b in response.aggregations["comp"].buckets:
+    response = await s.execute()
+    while True:
+        comp = response.aggregations["comp"]
+        for b in comp.buckets:
             yield cast(CompositeAggregate, b)
-        if "after_key" in response.aggregations["comp"]:
-            after = response.aggregations["comp"].after_key
+        # pipeline aggregations in inner_aggs can remove buckets from a page,
+        # so neither a short nor an empty page means that there are no more
+        # buckets, only a missing after_key does
+        if "after_key" in comp:
+            bucket.after = comp.after_key
+        elif comp.buckets:
+            bucket.after = comp.buckets[-1].key
         else:
-            after = response.aggregations["comp"].buckets[-1].key
-        response = await run_search(after=after)
+            break
+        # the search caches its response, make sure the next page is fetched
+        response = await s.execute(ignore_cache=True)
 
 
 async def main() -> None:
-    # initiate the default connection to elasticsearch
+    # initiate the default connection to elasticsearch, with gzip compression
+    # as the pages of composite aggregation buckets are large and repetitive
     client = async_connections.create_connection(
-        hosts=[os.environ["ELASTICSEARCH_URL"]]
+        hosts=[os.environ["ELASTICSEARCH_URL"]], http_compress=True
     )
 
     # create the index and populate it with some data
@@ -38,6 +38,12 @@ It is used to showcase several key features of elasticsearch-dsl:
         * Question.search_answers shows how to query for children of a
           particular parent
 
+        * Question.search_with_answers shows how to fetch questions together
+          with their answers using inner_hits
+
+        * Answer.prefetch_questions shows how to load the parents of many
+          children with a single mget request
+
 """
 import asyncio
 import os
@@ -52,6 +58,7 @@ from elasticsearch_dsl import (
     Join,
     Keyword,
     Long,
+    Q,
     Text,
     async_connections,
     mapped_field,
@@ -148,6 +155,20 @@ class Question(Post):
     def search(cls, **kwargs: Any) -> AsyncSearch:  # type: ignore[override]
         return cls._index.search(**kwargs).filter("term", question_answer="question")
 
+    @classmethod
+    def search_with_answers(cls, answers_per_question: int = 5) -> AsyncSearch:
+        """
+        Search for questions that have answers, returning up to
+        ``answers_per_question`` of them as inner hits so that get_answers
+        doesn't need another request for every question.
+        """
+        return cls.search().query(
+            "has_child",
+            type="answer",
+            query=Q("match_all"),
+            inner_hits={"size": answers_per_question},
+        )
+
     async def add_answer(
         self,
         user: User,
@@ -218,6 +239,33 @@ class Answer(Post):
             )
         return cast(Optional[Question], self.meta.question)
 
+    @classmethod
+    async def prefetch_questions(cls, answers: List["Answer"]) -> None:
+        """
+        Load the questions of all the given answers with a single request and
+        cache them in the answers' meta, like get_question does.
+        """
+        # answers can come from different indices, look each question up in
+        # the index of its answer
+        keys = list(
+            {
+                (a.meta.index, a.question_answer.parent)
+                for a in answers
+                if "question" not in a.meta
+            }
+        )
+        if not keys:
+            return
+        questions = await Question.mget(
+            [{"_index": index, "_id": id} for index, id in keys]
+        )
+        questions_by_key = dict(zip(keys, questions))
+        for a in answers:
+            if "question" not in a.meta:
+                a.meta.question = questions_by_key[
+                    (a.meta.index, a.question_answer.parent)
+                ]
+
     async def save(self, **kwargs: Any) -> None:  # type: ignore[override]
         # set routing to parents id automatically
         self.meta.routing = self.question_answer.parent
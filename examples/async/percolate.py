@@ -53,13 +53,17 @@ class BlogPost(AsyncDocument):
         s = s.query(
             "percolate", field="query", index=self._get_index(), document=self.to_dict()
         )
-
-        # collect all the tags from matched percolators
-        async for percolator in s:
-            self.tags.extend(percolator.tags)
-
-        # make sure tags are unique
-        self.tags = list(set(self.tags))
+        # only the tags of the matching percolators are needed, don't fetch the
+        # stored queries with them
+        s = s.source(["tags"])
+
+        # collect all the tags from matched percolators, keeping them unique and
+        # in the order they were found. scan() goes through every match, not
+        # just the first page of hits
+        tags = dict.fromkeys(self.tags)
+        async for percolator in s.scan():
+            tags.update(dict.fromkeys(percolator.tags))
+        self.tags = list(tags)
 
     async def save(self, **kwargs: Any) -> None:  # type: ignore[override]
         await self.add_tags()
@@ -27,7 +27,7 @@ To custom analyzer with ascii folding allow search to work in different language
 
 import asyncio
 import os
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 from elasticsearch_dsl import (
     AsyncDocument,
@@ -69,15 +69,18 @@ async def main() -> None:
         "Henri de Toulouse-Lautrec",
         "Jára Cimrman",
     ]
-    for id, name in enumerate(names):
-        await Person(_id=id, name=name).save()
 
-    # refresh index manually to make changes live
-    await Person._index.refresh()
+    async def get_next_person() -> AsyncIterator[Person]:
+        for id, name in enumerate(names):
+            yield Person(_id=id, name=name)
+
+    # refresh the index as part of the bulk request to make the changes live
+    await Person.bulk(get_next_person(), refresh=True)
 
     # run some suggestions
     for text in ("já", "Cimr", "toulouse", "Henri Tou", "a"):
-        s = Person.search()
+        # only the name is displayed, don't fetch the rest of the document
+        s = Person.search().source(["name"])
 
         s.query = MultiMatch(  # type: ignore[assignment]
             query=text,
@@ -16,11 +16,11 @@
 #  under the License.
 
 import os
-from typing import Any, Dict, Iterator, Mapping, Sequence, cast
+from typing import Dict, Iterator, Mapping, Sequence, cast
 
 from elasticsearch.helpers import bulk
 
-from elasticsearch_dsl import Agg, Response, Search, aggs, connections
+from elasticsearch_dsl import Agg, Search, aggs, connections
 from elasticsearch_dsl.types import CompositeAggregate
 from tests.test_integration.test_data import DATA, GIT_INDEX
 
@@ -29,7 +29,7 @@ def scan_aggs(
     search: Search,
     source_aggs: Sequence[Mapping[str, Agg]],
     inner_aggs: Dict[str, Agg] = {},
-    size: int = 10,
+    size: int = 1000,
 ) -> Iterator[CompositeAggregate]:
     """
     Helper function used to iterate over all possible bucket combinations of
@@ -37,34 +37,37 @@ def scan_aggs(
     ``composite`` aggregation under the hood to perform this.
     """
 
-    def run_search(**kwargs: Any) -> Response:
-        s = search[:0]
-        bucket = s.aggs.bucket(
-            "comp",
-            aggs.Composite(
-                sources=source_aggs,
-                size=size,
-                **kwargs,
-            ),
-        )
-        for agg_name, agg in inner_aggs.items():
-            bucket[agg_name] = agg
-        return s.execute()
+    # build the search once and only move the composite aggregation forward
+    # for every page; the hits are not needed, skip fetching and counting them
+    s = search[:0].extra(track_total_hits=False)
+    bucket = s.aggs.bucket("comp", aggs.Composite(sources=source_aggs, size=size))
+    for agg_name, agg in inner_aggs.items():
+        bucket[agg_name] = agg
 
-    response = run_search()
-    while response.aggregations["comp"].buckets:
-        for b in response.aggregations["comp"].buckets:
+    response = s.execute()
+    while True:
+        comp = response.aggregations["comp"]
+        for b in comp.buckets:
             yield cast(CompositeAggregate, b)
-        if "after_key" in response.aggregations["comp"]:
-            after = response.aggregations["comp"].after_key
+        # pipeline aggregations in inner_aggs can remove buckets from a page,
+        # so neither a short nor an empty page means that there are no more
+        # buckets, only a missing after_key does
+        if "after_key" in comp:
+            bucket.after = comp.after_key
+        elif comp.buckets:
+            bucket.after = comp.buckets[-1].key
         else:
-            after = response.aggregations["comp"].buckets[-1].key
-        response = run_search(after=after)
+            break
+        # the search caches its response, make sure the next page is fetched
+        response = s.execute(ignore_cache=True)
 
 
 def main() -> None:
-    # initiate the default connection to elasticsearch
-    client = connections.create_connection(hosts=[os.environ["ELASTICSEARCH_URL"]])
+    # initiate the default connection to elasticsearch, with gzip compression
+    # as the pages of composite aggregation buckets are large and repetitive
+    client = connections.create_connection(
+        hosts=[os.environ["ELASTICSEARCH_URL"]], http_compress=True
+    )
 
     # create the index and populate it with some data
     # note that the dataset is imported from the library's test suite
@@ -26,7 +26,7 @@ To custom analyzer with ascii folding allow search to work in different language
 """
 
 import os
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from elasticsearch_dsl import Document, SearchAsYouType, connections, mapped_field
 from elasticsearch_dsl.query import MultiMatch
@@ -63,15 +63,18 @@ def main() -> None:
         "Henri de Toulouse-Lautrec",
         "Jára Cimrman",
     ]
-    for id, name in enumerate(names):
-        Person(_id=id, name=name).save()
 
-    # refresh index manually to make changes live
-    Person._index.refresh()
+    def get_next_person() -> Iterator[Person]:
+        for id, name in enumerate(names):
+            yield Person(_id=id, name=name)
+
+    # refresh the index as part of the bulk request to make the changes live
+    Person.bulk(get_next_person(), refresh=True)
 
     # run some suggestions
     for text in ("já", "Cimr", "toulouse", "Henri Tou", "a"):
-        s = Person.search()
+        # only the name is displayed, don't fetch the rest of the document
+        s = Person.search().source(["name"])
 
         s.query = MultiMatch(  # type: ignore[assignment]
             query=text,
@@ -47,7 +47,7 @@ import argparse
 import json
 import os
 from datetime import datetime
-from typing import Any, List, Optional, cast
+from typing import Any, Iterator, List, Optional, cast
 from urllib.request import urlopen
 
 import nltk  # type: ignore
@@ -77,7 +77,11 @@ embedding_model: Any = None
 
 class Passage(InnerDoc):
     content: str
-    embedding: List[float] = mapped_field(DenseVector())
+    # store the vectors quantized to int8 in the HNSW index, which makes it 4x
+    # smaller and faster to search than with float32 vectors
+    embedding: List[float] = mapped_field(
+        DenseVector(index_options={"type": "int8_hnsw"})
+    )
 
 
 class WorkplaceDoc(Document):
@@ -95,20 +99,24 @@ class WorkplaceDoc(Document):
 
     @classmethod
     def get_embedding(cls, input: str) -> List[float]:
+        return cls.get_embeddings([input])[0]
+
+    @classmethod
+    def get_embeddings(cls, inputs: List[str]) -> List[List[float]]:
         global embedding_model
         if embedding_model is None:
             embedding_model = SentenceTransformer(MODEL_NAME)
-        return cast(List[float], list(embedding_model.encode(input)))
+        # encoding all the inputs in one call lets the model process them in
+        # batches, which is much faster than encoding them one at a time
+        return [list(embedding) for embedding in embedding_model.encode(inputs)]
 
     def clean(self) -> None:
         # split the content into sentences
         passages = cast(List[str], nltk.sent_tokenize(self.content))
 
         # generate an embedding for each passage and save it as a nested document
-        for passage in passages:
-            self.passages.append(
-                Passage(content=passage, embedding=self.get_embedding(passage))
-            )
+        for passage, embedding in zip(passages, self.get_embeddings(passages)):
+            self.passages.append(Passage(content=passage, embedding=embedding))
 
 
 def create() -> None:
@@ -119,27 +127,35 @@ def create() -> None:
     # download the data
     dataset = json.loads(urlopen(DATASET_URL).read())
 
-    # import the dataset
-    for data in tqdm(dataset, desc="Indexing documents..."):
-        doc = WorkplaceDoc(
-            name=data["name"],
-            summary=data["summary"],
-            content=data["content"],
-            created=data.get("created_on"),
-            updated=data.get("updated_at"),
-            url=data["url"],
-            category=data["category"],
-        )
-        doc.save()
+    # import the dataset in bulk requests instead of one request per document
+    def get_next_document() -> Iterator[WorkplaceDoc]:
+        for data in tqdm(dataset, desc="Indexing documents..."):
+            yield WorkplaceDoc(
+                name=data["name"],
+                summary=data["summary"],
+                content=data["content"],
+                created=data.get("created_on"),
+                updated=data.get("updated_at"),
+                url=data["url"],
+                category=data["category"],
+            )
+
+    WorkplaceDoc.bulk(get_next_document())
 
 
 def search(query: str) -> Search[WorkplaceDoc]:
-    return WorkplaceDoc.search().knn(
-        field=WorkplaceDoc.passages.embedding,
-        k=5,
-        num_candidates=50,
-        query_vector=list(WorkplaceDoc.get_embedding(query)),
-        inner_hits={"size": 2},
+    return (
+        WorkplaceDoc.search()
+        .knn(
+            field=WorkplaceDoc.passages.embedding,
+            k=5,
+            num_candidates=50,
+            query_vector=list(WorkplaceDoc.get_embedding(query)),
+            inner_hits={"size": 2},
+        )
+        # the passages (with their embeddings) are returned in the inner hits,
+        # only fetch the fields of the document that are displayed
+        .source(["name", "summary", "category"])
     )
 
 
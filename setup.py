@@ -23,9 +23,8 @@ VERSION = (8, 17, 1)
 __version__ = VERSION
 __versionstr__ = ".".join(map(str, VERSION))
 
-f = open(join(dirname(__file__), "README"))
-long_description = f.read().strip()
-f.close()
+with open(join(dirname(__file__), "README"), encoding="utf-8") as f:
+    long_description = f.read().strip()
 
 install_requires = [
     "python-dateutil",
@@ -73,7 +72,9 @@ setup(
     version=__versionstr__,
     author="Elastic Client Library Maintainers",
     author_email="client-libs@elastic.co",
-    packages=find_packages(where=".", exclude=("tests*",)),
+    packages=find_packages(
+        where=".", include=("elasticsearch_dsl", "elasticsearch_dsl.*")
+    ),
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -636,6 +636,16 @@ def test_from_es_respects_underscored_non_meta_fields() -> None:
     assert c._tagline == "You know, for search"
 
 
+def test_from_es_uses_fields_added_to_mapping_later() -> None:
+    class Company(AsyncDocument):
+        pass
+
+    Company._doc_type.mapping.field("founded", "date")
+    c = Company.from_es({"_source": {"founded": "2012-02-08"}})
+
+    assert c.founded == datetime(2012, 2, 8)
+
+
 def test_nested_and_object_inner_doc() -> None:
     class MySubDocWithNested(MyDoc):
         nested_inner = field.Nested(MyInner)
@@ -29,6 +29,15 @@ def test_mapping_can_has_fields() -> None:
     } == m.to_dict()
 
 
+def test_cloned_empty_mapping_does_not_share_fields() -> None:
+    m = AsyncMapping()
+    m2 = m._clone()
+    m2.field("title", "text")
+
+    assert {"properties": {"title": {"type": "text"}}} == m2.to_dict()
+    assert {} == m.to_dict()
+
+
 def test_mapping_update_is_recursive() -> None:
     m1 = AsyncMapping()
     m1.field("title", "text")
@@ -68,6 +68,17 @@ def test_cloned_index_has_copied_settings_and_using() -> None:
     assert i._settings is not i2._settings
 
 
+def test_cloned_index_has_independent_mapping() -> None:
+    i = Index("my-index")
+    i.get_or_create_mapping()
+
+    i2 = i.clone("my-other-index")
+    i2.get_or_create_mapping().field("title", "text")
+
+    assert "title" in i2.to_dict()["mappings"]["properties"]
+    assert "mappings" not in i.to_dict()
+
+
 def test_cloned_index_has_analysis_attribute() -> None:
     """
     Regression test for Issue #582 in which `AsyncIndex.clone()` was not copying
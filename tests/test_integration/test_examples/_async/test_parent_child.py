@@ -114,3 +114,39 @@ async def test_question_answer(
     assert isinstance(a, Answer)
     assert isinstance(await a.get_question(), Question)
     assert (await a.get_question()).meta.id == "1"
+
+
+@pytest.mark.asyncio
+async def test_prefetch_questions(
+    async_write_client: AsyncElasticsearch, question: Question
+) -> None:
+    await question.add_answer(honza, "Just use `elasticsearch-py`!")
+    await question.add_answer(nick, "Use elasticsearch-dsl")
+    await Question._index.refresh()
+
+    answers = await question.get_answers()
+    assert 2 == len(answers)
+    await Answer.prefetch_questions(answers)
+
+    for a in answers:
+        assert "question" in a.meta
+        assert isinstance(a.meta.question, Question)
+        assert (await a.get_question()).meta.id == "1"
+
+
+@pytest.mark.asyncio
+async def test_search_with_answers(
+    async_write_client: AsyncElasticsearch, question: Question
+) -> None:
+    await question.add_answer(honza, "Just use `elasticsearch-py`!")
+    await Question._index.refresh()
+
+    response = await Question.search_with_answers().execute()
+
+    assert 1 == len(response.hits)
+    q = response.hits[0]
+    assert isinstance(q, Question)
+    answers = await q.get_answers()
+    assert answers is q.meta.inner_hits.answer.hits
+    assert 1 == len(answers)
+    assert isinstance(answers[0], Answer)
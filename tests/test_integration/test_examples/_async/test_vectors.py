@@ -31,19 +31,22 @@ from ..async_examples import vectors
 async def test_vector_search(
     async_write_client: AsyncElasticsearch, es_version: Tuple[int, ...], mocker: Any
 ) -> None:
-    # this test only runs on Elasticsearch >= 8.11 because the example uses
-    # a dense vector without specifying an explicit size
-    if es_version < (8, 11):
-        raise SkipTest("This test requires Elasticsearch 8.11 or newer")
+    # this test only runs on Elasticsearch >= 8.12 because the example uses
+    # a dense vector without specifying an explicit size and int8 quantization
+    if es_version < (8, 12):
+        raise SkipTest("This test requires Elasticsearch 8.12 or newer")
 
     class MockModel:
         def __init__(self, model: Any):
             pass
 
-        def encode(self, text: str) -> List[float]:
-            vector = [int(ch) for ch in md5(text.encode()).digest()]
-            total = sum(vector)
-            return [float(v) / total for v in vector]
+        def encode(self, texts: List[str]) -> List[List[float]]:
+            vectors = []
+            for text in texts:
+                vector = [int(ch) for ch in md5(text.encode()).digest()]
+                total = sum(vector)
+                vectors.append([float(v) / total for v in vector])
+            return vectors
 
     mocker.patch.object(vectors, "SentenceTransformer", new=MockModel)
 
@@ -109,3 +109,35 @@ def test_question_answer(write_client: Elasticsearch, question: Question) -> Non
     assert isinstance(a, Answer)
     assert isinstance(a.get_question(), Question)
     assert (a.get_question()).meta.id == "1"
+
+
+@pytest.mark.sync
+def test_prefetch_questions(write_client: Elasticsearch, question: Question) -> None:
+    question.add_answer(honza, "Just use `elasticsearch-py`!")
+    question.add_answer(nick, "Use elasticsearch-dsl")
+    Question._index.refresh()
+
+    answers = question.get_answers()
+    assert 2 == len(answers)
+    Answer.prefetch_questions(answers)
+
+    for a in answers:
+        assert "question" in a.meta
+        assert isinstance(a.meta.question, Question)
+        assert (a.get_question()).meta.id == "1"
+
+
+@pytest.mark.sync
+def test_search_with_answers(write_client: Elasticsearch, question: Question) -> None:
+    question.add_answer(honza, "Just use `elasticsearch-py`!")
+    Question._index.refresh()
+
+    response = Question.search_with_answers().execute()
+
+    assert 1 == len(response.hits)
+    q = response.hits[0]
+    assert isinstance(q, Question)
+    answers = q.get_answers()
+    assert answers is q.meta.inner_hits.answer.hits
+    assert 1 == len(answers)
+    assert isinstance(answers[0], Answer)
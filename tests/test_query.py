@@ -131,6 +131,27 @@ def test_query_clone() -> None:
     assert bool is not bool_clone
 
 
+def test_bool_equality_ignores_empty_clauses() -> None:
+    assert query.Bool() == query.Bool(must=[])
+    assert query.Bool(must=[query.Match(f=1)]) == query.Bool(
+        must=[query.Match(f=1)], should=[]
+    )
+    assert query.Bool(must=[query.Match(f=1)]) != query.Bool(
+        must=[query.Match(f=2)]
+    )
+
+
+def test_bool_operators_do_not_mutate_operands() -> None:
+    q1 = query.Bool(must=[query.Match(f=1)], should=[query.Match(f=2)])
+    q2 = query.Bool(must=[query.Match(f=3)])
+
+    q1 + q2
+    q1 & q2
+
+    assert q1 == query.Bool(must=[query.Match(f=1)], should=[query.Match(f=2)])
+    assert q2 == query.Bool(must=[query.Match(f=3)])
+
+
 def test_bool_converts_its_init_args_to_queries() -> None:
     q = query.Bool(must=[{"match": {"f": "value"}}])  # type: ignore
 
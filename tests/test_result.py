@@ -57,6 +57,7 @@ def test_hit_is_pickleable(dummy_response: Dict[str, Any]) -> None:
 
     assert hits == res.hits
     assert hits[0].meta == res.hits[0].meta
+    assert hits.total == res.hits.total  # type: ignore[attr-defined]
 
 
 def test_response_stores_search(dummy_response: Dict[str, Any]) -> None:
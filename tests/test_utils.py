@@ -20,7 +20,7 @@ from typing import Any, Dict, Tuple
 
 from pytest import raises
 
-from elasticsearch_dsl import Q, serializer, utils
+from elasticsearch_dsl import A, Q, aggs, query, serializer, utils
 
 
 def test_attrdict_pickle() -> None:
@@ -71,6 +71,15 @@ def test_merge() -> None:
     assert a == {"a": {"b": 123, "c": 47, "d": -12}, "e": [1, 2, 3]}
 
 
+def test_merge_deeply_nested() -> None:
+    a: Dict[str, Any] = {"a": {"b": {"c": {"d": 1}}}, "x": 1}
+    b = {"a": {"b": {"c": {"e": 2}, "f": [3]}}}
+
+    utils.merge(a, b)
+
+    assert a == {"a": {"b": {"c": {"d": 1, "e": 2}, "f": [3]}}, "x": 1}
+
+
 def test_merge_conflict() -> None:
     data: Tuple[Dict[str, Any], ...] = (
         {"a": 42},
@@ -82,6 +91,18 @@ def test_merge_conflict() -> None:
             utils.merge({"a": {"b": 42}}, d, True)
 
 
+def test_attrdict_attribute_access_uses_overridden_getitem() -> None:
+    class UpperAttrDict(utils.AttrDict[str]):
+        def __getitem__(self, key: str) -> Any:
+            return super().__getitem__(key).upper()
+
+    d = UpperAttrDict({"title": "Title"})
+
+    assert "TITLE" == d.title
+    with raises(AttributeError):
+        d.missing
+
+
 def test_attrdict_bool() -> None:
     d: utils.AttrDict[str] = utils.AttrDict({})
 
@@ -99,6 +120,16 @@ def test_attrlist_items_get_wrapped_during_iteration() -> None:
     assert isinstance(l[3], utils.AttrDict)
 
 
+def test_attrlist_contains() -> None:
+    al = utils.AttrList([1, {"a": 1}, [2]])
+
+    assert 1 in al
+    assert {"a": 1} in al
+    assert utils.AttrDict({"a": 1}) in al
+    assert utils.AttrList([2]) in al
+    assert 3 not in al
+
+
 def test_serializer_deals_with_Attr_versions() -> None:
     d = utils.AttrDict({"key": utils.AttrList([1, 2, 3])})
 
@@ -134,3 +165,55 @@ def test_attrdict_with_reserved_keyword() -> None:
     d = utils.AttrDict({})
     d.from_ = 10
     assert {"from": 10} == d.to_dict()
+
+
+def test_typed_and_multi_params_are_wrapped_serialized_and_cloned() -> None:
+    q = Q("bool", must={"match": {"title": "python"}}, minimum_should_match=1)
+
+    assert [query.Match(title="python")] == q.must
+    assert 1 == q.minimum_should_match
+    assert {
+        "bool": {"must": [{"match": {"title": "python"}}], "minimum_should_match": 1}
+    } == q.to_dict()
+
+    q2 = q._clone()
+    q2.must.append(query.Term(tags="django"))
+    assert [query.Match(title="python")] == q.must
+
+    fs = Q("function_score", query={"match": {"title": "python"}}, boost_mode="sum")
+    assert query.Match(title="python") == fs.query
+    assert {
+        "function_score": {"query": {"match": {"title": "python"}}, "boost_mode": "sum"}
+    } == fs.to_dict()
+
+
+def test_hash_params_are_wrapped_and_serialized() -> None:
+    a = A("terms", field="tags", aggs={"max_score": {"max": {"field": "score"}}})
+
+    assert aggs.Max(field="score") == a.aggs["max_score"]
+    assert {
+        "terms": {"field": "tags"},
+        "aggs": {"max_score": {"max": {"field": "score"}}},
+    } == a.to_dict()
+
+
+def test_param_defs_of_subclasses_are_used() -> None:
+    class Custom(query.Query):
+        name = "test_custom_param_defs"
+        _param_defs = {
+            "query": {"type": "query"},
+            "clauses": {"type": "query", "multi": True},
+        }
+
+    q = Q("test_custom_param_defs", query={"match_all": {}}, clauses={"term": {"a": 1}})
+
+    assert isinstance(q, Custom)
+    assert query.MatchAll() == q.query
+    assert [query.Term(a=1)] == q.clauses
+    assert {
+        "test_custom_param_defs": {
+            "query": {"match_all": {}},
+            "clauses": [{"term": {"a": 1}}],
+        }
+    } == q.to_dict()
+    assert q == q._clone()
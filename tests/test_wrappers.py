@@ -60,6 +60,13 @@ def test_range_not_contains(
     assert item not in Range(**kwargs)
 
 
+def test_range_contains_raises_for_items_that_cannot_be_compared() -> None:
+    with pytest.raises(TypeError):
+        object() in Range(gt=1)
+    with pytest.raises(TypeError):
+        None in Range(lte=4, gte=2)
+
+
 @pytest.mark.parametrize(
     "args,kwargs",
     [
@@ -82,7 +82,7 @@ def A(
         if meta:
             params = params.copy()
             params["meta"] = meta
-        return Agg[_R].get_dsl_class(agg_type)(_expand__to_dot=False, **params)
+        return Agg.get_dsl_class(agg_type)(_expand__to_dot=False, **params)
 
     # Terms(...) just return the nested agg
     elif isinstance(name_or_agg, Agg):
@@ -93,7 +93,9 @@ def A(
         return name_or_agg
 
     # "terms", field="tags"
-    return Agg[_R].get_dsl_class(name_or_agg)(**params)
+    # look the class up on Agg itself, subscripting the generic class on
+    # every call is several times slower than the registry lookup
+    return Agg.get_dsl_class(name_or_agg)(**params)
 
 
 class Agg(DslBase, Generic[_R]):
@@ -83,6 +83,11 @@ def Q(
     ] = "match_all",
     **params: Any,
 ) -> Union["Query", _T]:
+    # "match", title="python" is by far the most common call, check for it
+    # first to skip the (comparatively slow) ABC instance check below
+    if type(name_or_query) is str:
+        return Query.get_dsl_class(name_or_query)(**params)
+
     # {"match": {"title": "python"}}
     if isinstance(name_or_query, collections.abc.MutableMapping):
         if params:
@@ -198,10 +203,11 @@ class {{ k.name }}({{ parent }}):
         {% if k.name == "FunctionScore" %}
             {# continuation of the FunctionScore shortcut property support from above #}
         if functions is DEFAULT:
-            functions = []
-            for name in ScoreFunction._classes:
-                if name in kwargs:
-                    functions.append({name: kwargs.pop(name)})  # type: ignore
+            functions = [  # type: ignore
+                {name: kwargs.pop(name)}
+                for name in ScoreFunction._classes
+                if name in kwargs
+            ]
         {% elif k.is_single_field %}
         if _field is not DEFAULT:
             kwargs[str(_field)] = _value
@@ -253,6 +259,15 @@ EMPTY_QUERY = MatchAll()
         return MatchAll()
 
     {% elif k.name == "Bool" %}
+    def _clone(self) -> "Bool":
+        # all of Bool's state lives in _params, so skip the generated __init__
+        # and only copy the clause lists that the operators below mutate
+        q = object.__new__(self.__class__)
+        q._params = {
+            k: v[:] if type(v) is list else v for k, v in self._params.items()
+        }
+        return q
+
     def __add__(self, other: Query) -> "Bool":
         q = self._clone()
         if isinstance(other, Bool):
@@ -269,7 +284,7 @@ EMPTY_QUERY = MatchAll()
     def __or__(self, other: Query) -> Query:
         for q in (self, other):
             if isinstance(q, Bool) and not any(
-                (q.must, q.must_not, q.filter, getattr(q, "minimum_should_match", None))
+                (q.must, q.must_not, q.filter, q._params.get("minimum_should_match"))
             ):
                 other = self if q is other else other
                 q = q._clone()
@@ -278,7 +293,7 @@ EMPTY_QUERY = MatchAll()
                         other.must,
                         other.must_not,
                         other.filter,
-                        getattr(other, "minimum_should_match", None),
+                        other._params.get("minimum_should_match"),
                     )
                 ):
                     q.should.extend(other.should)
@@ -292,16 +307,17 @@ EMPTY_QUERY = MatchAll()
 
     @property
     def _min_should_match(self) -> int:
-        return getattr(
-            self,
-            "minimum_should_match",
-            0 if not self.should or (self.must or self.filter) else 1,
-        )
+        # read _params directly, getattr() with a default has to raise and
+        # catch an AttributeError whenever minimum_should_match is not set
+        msm = self._params.get("minimum_should_match")
+        if msm is not None:
+            return cast(int, msm)
+        return 0 if not self.should or (self.must or self.filter) else 1
 
     def __invert__(self) -> Query:
         # Because an empty Bool query is treated like
         # MatchAll the inverse should be MatchNone
-        if not any(chain(self.must, self.filter, self.should, self.must_not)):
+        if not (self.must or self.filter or self.should or self.must_not):
             return MatchNone()
 
         negations: List[Query] = []
@@ -312,7 +328,7 @@ EMPTY_QUERY = MatchAll()
             negations.append(q)
 
         if self.should and self._min_should_match:
-            negations.append(Bool(must_not=self.should[:]))
+            negations.append(Bool(must_not=self.should))
 
         if len(negations) == 1:
             return negations[0]
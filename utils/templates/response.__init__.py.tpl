@@ -18,6 +18,7 @@
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generic,
     Iterator,
@@ -43,6 +44,38 @@ if TYPE_CHECKING:
 __all__ = ["Response", "AggResponse", "UpdateByQueryResponse", "Hit", "HitMeta", "AggregateResponseType"]
 
 
+class _HitsList(AttrList[_R]):
+    """
+    The list of hits of a response. The other keys of the ``hits`` section
+    (``total``, ``max_score``, ...) are exposed as attributes and only wrapped
+    when first accessed.
+    """
+
+    def __init__(self, hits: List[_R], meta: Dict[str, Any]):
+        super().__init__(hits)
+        self._meta = meta
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            value = self._meta[name]
+        except KeyError:
+            return super().__getattr__(name)
+        # store the wrapped value on the instance, later reads won't get here
+        value = _wrap(value)
+        setattr(self, name, value)
+        return value
+
+    def __getstate__(  # type: ignore[override]
+        self,
+    ) -> Tuple[List[_R], Optional[Callable[[_R], Any]], Dict[str, Any]]:
+        return self._l_, self._obj_wrapper, self._meta
+
+    def __setstate__(
+        self, state: Tuple[List[_R], Optional[Callable[[_R], Any]], Dict[str, Any]]  # type: ignore[override]
+    ) -> None:
+        self._l_, self._obj_wrapper, self._meta = state
+
+
 class Response(AttrDict[Any], Generic[_R]):
     """An Elasticsearch search response.
 
@@ -52,10 +85,12 @@ class Response(AttrDict[Any], Generic[_R]):
         {% endfor %}
     {% endfor %}
     """
+    __slots__ = ("_search", "_doc_class", "_hits", "_aggs")
     _search: "SearchBase[_R]"
     _faceted_search: "FacetedSearchBase[_R]"
     _doc_class: Optional[_R]
-    _hits: List[_R]
+    _hits: Optional[List[_R]]
+    _aggs: Optional["AggResponse[_R]"]
 
     {% for arg in response.args %}
         {% if arg.name not in ["hits", "aggregations"] %}
@@ -71,6 +106,8 @@ class Response(AttrDict[Any], Generic[_R]):
     ):
         super(AttrDict, self).__setattr__("_search", search)
         super(AttrDict, self).__setattr__("_doc_class", doc_class)
+        super(AttrDict, self).__setattr__("_hits", None)
+        super(AttrDict, self).__setattr__("_aggs", None)
         super().__init__(response)
 
     def __iter__(self) -> Iterator[_R]:  # type: ignore[override]
@@ -94,6 +131,8 @@ class Response(AttrDict[Any], Generic[_R]):
         return len(self.hits)
 
     def __getstate__(self) -> Tuple[Dict[str, Any], "Request[_R]", Optional[_R]]:  # type: ignore[override]
+        # the wrapped hits and aggs are not pickled, they are rebuilt from the
+        # raw response on first access after unpickling
         return self._d_, self._search, self._doc_class
 
     def __setstate__(
@@ -102,25 +141,27 @@ class Response(AttrDict[Any], Generic[_R]):
         super(AttrDict, self).__setattr__("_d_", state[0])
         super(AttrDict, self).__setattr__("_search", state[1])
         super(AttrDict, self).__setattr__("_doc_class", state[2])
+        super(AttrDict, self).__setattr__("_hits", None)
+        super(AttrDict, self).__setattr__("_aggs", None)
 
     def success(self) -> bool:
         return self._shards.total == self._shards.successful and not self.timed_out
 
     @property
     def hits(self) -> List[_R]:
-        if not hasattr(self, "_hits"):
-            h = cast(AttrDict[Any], self._d_["hits"])
+        if self._hits is None:
+            h = cast(Dict[str, Any], self._d_["hits"])
 
             try:
-                hits = AttrList(list(map(self._search._get_result, h["hits"])))
+                get_result = self._search._get_result
+                hits = _HitsList([get_result(hit) for hit in h["hits"]], h)
             except AttributeError as e:
                 # avoid raising AttributeError since it will be hidden by the property
                 raise TypeError("Could not parse hits.", e)
 
             # avoid assigning _hits into self._d_
             super(AttrDict, self).__setattr__("_hits", hits)
-            for k in h:
-                setattr(self._hits, k, _wrap(h[k]))
+            return cast(List[_R], hits)
         return self._hits
 
     @property
@@ -129,7 +170,7 @@ class Response(AttrDict[Any], Generic[_R]):
 
     @property
     def aggs(self) -> "AggResponse[_R]":
-        if not hasattr(self, "_aggs"):
+        if self._aggs is None:
             aggs = AggResponse[_R](
                 cast("Agg[_R]", self._search.aggs),
                 self._search,
@@ -138,7 +179,8 @@ class Response(AttrDict[Any], Generic[_R]):
 
             # avoid assigning _aggs into self._d_
             super(AttrDict, self).__setattr__("_aggs", aggs)
-        return cast("AggResponse[_R]", self._aggs)
+            return aggs
+        return self._aggs
 
     def search_after(self) -> "SearchBase[_R]":
         """
@@ -178,6 +220,7 @@ AggregateResponseType = {{ response["aggregate_type"] }}
 
 class AggResponse(AttrDict[Any], Generic[_R]):
     """An Elasticsearch aggregation response."""
+    __slots__ = ("_meta",)
     _meta: Dict[str, Any]
 
     def __init__(self, aggs: "Agg[_R]", search: "Request[_R]", data: Dict[str, Any]):
@@ -185,9 +228,10 @@ class AggResponse(AttrDict[Any], Generic[_R]):
         super().__init__(data)
 
     def __getitem__(self, attr_name: str) -> AggregateResponseType:
-        if attr_name in self._meta["aggs"]:
+        aggs = self._meta["aggs"]
+        if attr_name in aggs:
             # don't do self._meta['aggs'][attr_name] to avoid copying
-            agg = self._meta["aggs"].aggs[attr_name]
+            agg = aggs.aggs[attr_name]
             return cast(AggregateResponseType, agg.result(self._meta["search"], self._d_[attr_name]))
         return super().__getitem__(attr_name)  # type: ignore
 
@@ -205,6 +249,7 @@ class UpdateByQueryResponse(AttrDict[Any], Generic[_R]):
         {% endfor %}
     {% endfor %}
     """
+    __slots__ = ("_search", "_doc_class")
     _search: "UpdateByQueryBase[_R]"
 
     {% for arg in ubq_response.args %}